@@ -0,0 +1,203 @@
+import zlib
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+# larger bodies are compressed in the threadpool so they don't stall the event loop
+THREADPOOL_SIZE = 256 * 1024
+# binary exports are large and barely shrink, so they are sent as they are
+UNCOMPRESSIBLE_TYPES = (
+    "application/octet-stream",
+    "application/vnd.apache.arrow",
+    "application/zip",
+    "application/gzip",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+ENCODINGS = [
+    encoding
+    for encoding, available in (("zstd", zstandard is not None), ("br", brotli is not None), ("gzip", True))
+    if available
+]
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class Compressor:
+    def __init__(self, encoding: str):
+        if encoding == "zstd":
+            compressobj = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self._compress, self._flush = compressobj.compress, compressobj.flush
+        elif encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress, self._flush = compressor.process, compressor.finish
+        else:
+            compressobj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._flush = compressobj.compress, compressobj.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def flush(self) -> bytes:
+        return self._flush()
+
+    def compress_chunk(self, data: bytes, final: bool) -> bytes:
+        return self._compress(data) + (self._flush() if final else b"")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    compressor = Compressor(encoding)
+    return compressor.compress(body) + compressor.flush()
+
+
+# strong validators must differ between content-codings, so each coding gets its own tag
+def encoded_etag(etag: str, encoding: str) -> str:
+    if not etag.startswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    if if_none_match is None:
+        return None
+    candidates = {etag, *(encoded_etag(etag, encoding) for encoding in ENCODINGS)}
+    for tag in (tag.strip() for tag in if_none_match.split(",")):
+        if tag == "*":
+            return etag
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in candidates:
+            return tag
+    return None
+
+
+class Payload:
+    def __init__(self, body: bytes, media_type: str = "application/json", headers: Optional[dict] = None):
+        self.body = body
+        self.media_type = media_type
+        self.headers = headers or {}
+        self._encoded = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        if (body := self._encoded.get(encoding)) is None:
+            body = self._encoded[encoding] = compress(self.body, encoding)
+        return body
+
+    def response(self, request: Request, minimum_size: int = 0) -> Response:
+        headers = {**self.headers, "Vary": "Accept-Encoding"}
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+        if encoding is None or len(self.body) < minimum_size:
+            return Response(content=self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        if "ETag" in headers:
+            headers["ETag"] = encoded_etag(headers["ETag"], encoding)
+        return Response(content=self.encoded(encoding), media_type=self.media_type, headers=headers)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+            if encoding is not None:
+                responder = CompressionResponder(self.app, encoding, self.minimum_size)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.initial_message = {}
+        self.started = False
+        self.compressor = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.initial_message = message
+        elif message_type == "http.response.body" and not self.started:
+            self.started = True
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(UNCOMPRESSIBLE_TYPES)
+                or (len(body) < self.minimum_size and not more_body)
+            ):
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            self.compressor = Compressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+            message["body"] = await self.compress(body, not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+        elif message_type == "http.response.body":
+            if self.compressor is not None:
+                message["body"] = await self.compress(message.get("body", b""), not message.get("more_body", False))
+            await self.send(message)
+
+    async def compress(self, body: bytes, final: bool) -> bytes:
+        if len(body) > THREADPOOL_SIZE:
+            return await run_in_threadpool(self.compressor.compress_chunk, body, final)
+        return self.compressor.compress_chunk(body, final)
@@ -0,0 +1,44 @@
+import json
+import os
+
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
+EXAMPLE_CONFIGS = 4
+EXAMPLE_WORDS = 10
+
+
+def load_fixture(filename: str):
+    with open(os.path.join(FIXTURES_DIR, filename)) as f:
+        return json.load(f)
+
+
+def all_phrase_example():
+    return dict(load_fixture("teste3.json"))
+
+
+def phrase_example():
+    example = dict(load_fixture("teste.json"))
+    example["topics"] = dict(list(example["topics"].items())[:EXAMPLE_CONFIGS])
+    return example
+
+
+def topic_example():
+    example = dict(load_fixture("teste2.json"))
+    example["word_probabilities"] = [
+        {**topic, "word_probabilities": topic["word_probabilities"][:EXAMPLE_WORDS]}
+        for topic in example["word_probabilities"]
+    ]
+    return example
+
+
+def without_id(factory):
+    def example():
+        return {k: v for k, v in factory().items() if k != "_id"}
+
+    return example
+
+
+def schema_extra(factory):
+    def extra(schema, model):
+        schema["example"] = factory()
+
+    return extra
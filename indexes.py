@@ -0,0 +1,21 @@
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import DuplicateKeyError
+
+import topic_index
+
+PHRASE_INDEXES = [
+    IndexModel([("txt_id", ASCENDING), ("_id", ASCENDING)]),
+    IndexModel([("a_id", ASCENDING), ("_id", ASCENDING)]),
+    IndexModel([("path", ASCENDING), ("_id", ASCENDING)]),
+    IndexModel([("section", ASCENDING), ("_id", ASCENDING)]),
+    IndexModel([("match_word", ASCENDING), ("_id", ASCENDING)]),
+]
+
+
+async def ensure_indexes(db):
+    await db["phrases"].create_indexes(PHRASE_INDEXES)
+    try:
+        await db[topic_index.COLLECTION].create_indexes(topic_index.INDEXES)
+    except DuplicateKeyError:
+        # postings left by builds from before the unique index; the next full build drops and recreates them
+        pass
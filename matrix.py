@@ -0,0 +1,181 @@
+import asyncio
+import io
+import re
+from array import array
+from collections import defaultdict
+
+import numpy as np
+
+from cache import LRUCache
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+NUMBER_OF_TOPICS_PATTERN = re.compile(r"^nt(\d+)_")
+SCORE_BATCH_SIZE = 65536
+
+
+class PhraseTopicMatrix:
+    def __init__(self, config: str, ids, indptr, indices, data, number_of_topics: int):
+        self.config = config
+        self.ids = ids
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.number_of_topics = number_of_topics
+        self._normalized = {}
+
+    @property
+    def shape(self):
+        return (len(self.ids), self.number_of_topics)
+
+    # not kept: exports need it once, and similar() only keeps the normalized copy it needs
+    def dense(self):
+        dense = np.zeros(self.shape, dtype=np.float32)
+        rows = np.repeat(np.arange(len(self.ids)), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+    def row(self, id: int):
+        index = int(np.searchsorted(self.ids, id))
+        if index < len(self.ids) and self.ids[index] == id:
+            return index
+        return None
+
+    def normalized(self, metric: str):
+        if (normalized := self._normalized.get(metric)) is None:
+            normalized = self.dense()
+            if metric == "cosine":
+                norms = np.linalg.norm(normalized, axis=1, keepdims=True)
+                np.divide(normalized, norms, out=normalized, where=norms > 0)
+            else:
+                sums = normalized.sum(axis=1, keepdims=True)
+                np.divide(normalized, sums, out=normalized, where=sums > 0)
+                np.sqrt(normalized, out=normalized)
+            self._normalized[metric] = normalized
+        return normalized
+
+    def similar(self, index: int, k: int, metric: str) -> list:
+        normalized = self.normalized(metric)
+        vector = normalized[index]
+        candidates, scores = [], []
+        for start in range(0, len(normalized), SCORE_BATCH_SIZE):
+            batch = normalized[start:start + SCORE_BATCH_SIZE] @ vector
+            if start <= index < start + SCORE_BATCH_SIZE:
+                batch[index - start] = -np.inf
+            top = np.argpartition(-batch, min(k, len(batch)) - 1)[:k]
+            candidates.append(top + start)
+            scores.append(batch[top])
+        candidates, scores = np.concatenate(candidates), np.concatenate(scores)
+        order = np.argsort(-scores, kind="stable")[:k]
+        candidates, scores = candidates[order], scores[order]
+        keep = np.isfinite(scores)
+        candidates, scores = candidates[keep], scores[keep]
+        # a similarity for every metric (higher is more similar): 1 - Hellinger distance for hellinger
+        if metric == "hellinger":
+            scores = 1 - np.sqrt(np.clip(1 - scores, 0, None))
+        return [(int(self.ids[i]), float(score)) for i, score in zip(candidates, scores)]
+
+    def to_npz(self, sparse: bool) -> bytes:
+        buffer = io.BytesIO()
+        if sparse:
+            np.savez(
+                buffer,
+                format=np.array(b"csr"),
+                shape=np.array(self.shape),
+                data=self.data,
+                indices=self.indices,
+                indptr=self.indptr,
+                ids=self.ids,
+            )
+        else:
+            np.savez(buffer, ids=self.ids, matrix=self.dense())
+        return buffer.getvalue()
+
+    def to_arrow(self, sparse: bool) -> bytes:
+        if sparse:
+            offsets = pyarrow.array(self.indptr.astype(np.int32))
+            columns = {
+                "_id": pyarrow.array(self.ids),
+                "topics": pyarrow.ListArray.from_arrays(offsets, pyarrow.array(self.indices)),
+                "probs": pyarrow.ListArray.from_arrays(offsets, pyarrow.array(self.data)),
+            }
+        else:
+            columns = {
+                "_id": pyarrow.array(self.ids),
+                "probs": pyarrow.FixedSizeListArray.from_arrays(
+                    pyarrow.array(self.dense().ravel()), self.number_of_topics
+                ),
+            }
+        table = pyarrow.table(columns)
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+def number_of_topics(config: str) -> int:
+    return int(NUMBER_OF_TOPICS_PATTERN.match(config).group(1))
+
+
+async def build(collection, config: str, batch_size: int = 10000) -> PhraseTopicMatrix:
+    path = f"topics.{config}.topics"
+    ids, indptr, indices, data = array("q"), array("q", [0]), array("i"), array("f")
+
+    cursor = collection.find({path: {"$exists": True}}, {path: 1}, sort=[("_id", 1)], batch_size=batch_size)
+    async for phrase in cursor:
+        for topic in phrase["topics"][config]["topics"] or []:
+            indices.append(topic["topic"])
+            data.append(topic["prob"])
+        ids.append(phrase["_id"])
+        indptr.append(len(indices))
+
+    indices = np.frombuffer(indices, dtype=np.int32)
+    topics = max(number_of_topics(config), int(indices.max()) + 1 if len(indices) else 0)
+    return PhraseTopicMatrix(
+        config,
+        np.frombuffer(ids, dtype=np.int64),
+        np.frombuffer(indptr, dtype=np.int64),
+        indices,
+        np.frombuffer(data, dtype=np.float32),
+        topics,
+    )
+
+
+class MatrixCache:
+    def __init__(self, collection_factory, versions_factory, maxsize: int = 4):
+        self.collection_factory = collection_factory
+        self.versions_factory = versions_factory
+        self._matrices = LRUCache(maxsize)
+        self._locks = defaultdict(asyncio.Lock)
+        self._generations = defaultdict(int)
+
+    # bumped by every process that writes a config, so the other workers notice their cached matrix is stale
+    async def version(self, config: str) -> int:
+        document = await self.versions_factory().find_one({"_id": config})
+        return document["version"] if document is not None else 0
+
+    async def get(self, config: str) -> PhraseTopicMatrix:
+        version = await self.version(config)
+        if (entry := self._matrices.get(config)) is not None and entry[0] == version:
+            return entry[1]
+        async with self._locks[config]:
+            if (entry := self._matrices.get(config)) is None or entry[0] != version:
+                generation = self._generations[config]
+                # a rebuild after a write must not read from a lagging secondary
+                matrix = await build(self.collection_factory(generation > 0 or entry is not None), config)
+                if generation == self._generations[config]:
+                    self._matrices.set(config, (version, matrix))
+                return matrix
+            return entry[1]
+
+    async def invalidate(self, configs=None):
+        configs = list(self._generations) if configs is None else list(configs)
+        for config in configs:
+            self._generations[config] += 1
+            self._matrices.invalidate(config)
+        for config in configs:
+            await self.versions_factory().update_one({"_id": config}, {"$inc": {"version": 1}}, upsert=True)
@@ -0,0 +1,36 @@
+import asyncio
+import hashlib
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from compression import ENCODINGS, Payload, matching_etag
+from json_response import dumps
+
+
+class OpenAPICache:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.payload = None
+        self._lock = None
+
+    def build(self):
+        body = dumps(self.app.openapi())
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        self.payload = Payload(body, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        for encoding in ENCODINGS:
+            self.payload.encoded(encoding)
+
+    async def response(self, request: Request) -> Response:
+        if self.payload is None:
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                if self.payload is None:
+                    # schema generation and the example fixtures take long enough to stall the event loop
+                    await run_in_threadpool(self.build)
+
+        if (etag := matching_etag(request.headers.get("if-none-match"), self.payload.headers["ETag"])) is not None:
+            return Response(status_code=304, headers={**self.payload.headers, "ETag": etag, "Vary": "Accept-Encoding"})
+        return self.payload.response(request)
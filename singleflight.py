@@ -0,0 +1,25 @@
+import asyncio
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key, fn):
+        if (future := self._calls.get(key)) is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def forget_where(self, predicate):
+        # later callers start a new flight instead of joining one that began before a write
+        for key in [key for key in self._calls if predicate(key)]:
+            del self._calls[key]
+
+    def _forget(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
@@ -0,0 +1,115 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from pymongo import ASCENDING, DESCENDING, DeleteMany, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+COLLECTION = "phrase_topics"
+BUILD_COLLECTION = "phrase_topics_build"
+BUILD_ID = "build"
+LEASE = timedelta(minutes=5)
+
+INDEXES = [
+    IndexModel([("config", ASCENDING), ("topic", ASCENDING), ("prob", DESCENDING), ("phrase_id", ASCENDING)]),
+    IndexModel([("phrase_id", ASCENDING), ("config", ASCENDING), ("topic", ASCENDING)], unique=True),
+]
+
+
+def postings(phrase: dict, configs=None) -> list:
+    entries = []
+    for config, topic_config in (phrase.get("topics") or {}).items():
+        if configs is not None and config not in configs:
+            continue
+        for topic in (topic_config or {}).get("topics") or []:
+            if topic.get("topic") is None or topic.get("prob") is None:
+                continue
+            entries.append(
+                {"phrase_id": phrase["_id"], "config": config, "topic": topic["topic"], "prob": topic["prob"]}
+            )
+    return entries
+
+
+async def index_phrases(collection, phrases: list, configs=None):
+    operations = []
+    for phrase in phrases:
+        entries = postings(phrase, configs)
+        query = {"phrase_id": phrase["_id"]}
+        if configs is not None:
+            query["config"] = {"$in": list(configs)}
+        if entries:
+            query["$nor"] = [{"config": entry["config"], "topic": entry["topic"]} for entry in entries]
+        operations.append(DeleteMany(query))
+        operations.extend(
+            UpdateOne(
+                {"phrase_id": entry["phrase_id"], "config": entry["config"], "topic": entry["topic"]},
+                {"$set": {"prob": entry["prob"]}},
+                upsert=True,
+            )
+            for entry in entries
+        )
+
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+
+
+async def acquire_lease(builds, owner: str) -> Optional[dict]:
+    now = datetime.utcnow()
+    try:
+        return await builds.find_one_and_update(
+            {"_id": BUILD_ID, "$or": [{"owner": owner}, {"lease_until": {"$lt": now}}]},
+            {"$set": {"owner": owner, "lease_until": now + LEASE}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        return None
+
+
+async def build(phrases, collection, batch_size: int = 1000):
+    builds = collection.database[BUILD_COLLECTION]
+    owner = uuid.uuid4().hex
+    if (state := await acquire_lease(builds, owner)) is None:
+        return
+
+    # the checkpoint is only advanced here, so phrases reindexed by the update endpoints can't move it
+    if (last_id := state.get("last_id")) is None:
+        await builds.update_one({"_id": BUILD_ID, "owner": owner}, {"$set": {"completed": False}})
+        await collection.drop()
+    await collection.create_indexes(INDEXES)
+    query = {} if last_id is None else {"_id": {"$gt": last_id}}
+
+    async def checkpoint(batch):
+        await index_phrases(collection, batch)
+        result = await builds.update_one(
+            {"_id": BUILD_ID, "owner": owner},
+            {"$set": {"last_id": batch[-1]["_id"], "lease_until": datetime.utcnow() + LEASE}},
+        )
+        return result.matched_count == 1
+
+    batch = []
+    async for phrase in phrases.find(query, {"topics": 1}, sort=[("_id", ASCENDING)], batch_size=batch_size):
+        batch.append(phrase)
+        if len(batch) >= batch_size:
+            if not await checkpoint(batch):
+                return
+            batch = []
+    if batch and not await checkpoint(batch):
+        return
+    await builds.update_one(
+        {"_id": BUILD_ID, "owner": owner}, {"$set": {"completed": True, "lease_until": datetime.utcnow()}}
+    )
+
+
+# until a full build has completed, top_phrases would only see part of the phrases
+async def ready(collection) -> bool:
+    state = await collection.database[BUILD_COLLECTION].find_one({"_id": BUILD_ID}, {"completed": 1})
+    return state is not None and state.get("completed", False)
+
+
+async def top_phrases(collection, config: str, topic: int, limit: int) -> list:
+    return await collection.find(
+        {"config": config, "topic": topic},
+        {"_id": 0, "phrase_id": 1, "prob": 1},
+        sort=[("prob", DESCENDING), ("phrase_id", ASCENDING)],
+        limit=limit,
+    ).to_list(limit)
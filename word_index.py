@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+
+class WordIndex:
+    def __init__(self):
+        self.ready = False
+        self._postings = defaultdict(dict)
+        self._words = {}
+        self._updated = None
+
+    def __len__(self):
+        return len(self._postings)
+
+    def add(self, topic: dict):
+        if self._updated is not None:
+            self._updated.add(topic["_id"])
+        self._add(topic)
+
+    def remove(self, config: str):
+        if self._updated is not None:
+            self._updated.add(config)
+        self._remove(config)
+
+    def _add(self, topic: dict):
+        config = topic["_id"]
+        self._remove(config)
+
+        words = set()
+        for word_probabilities in topic.get("word_probabilities") or []:
+            ranked = sorted(word_probabilities.get("word_probabilities") or [], key=lambda wp: -wp["prob"])
+            for rank, wp in enumerate(ranked, 1):
+                self._postings[wp["word"]].setdefault(config, []).append((word_probabilities["_id"], wp["prob"], rank))
+                words.add(wp["word"])
+        self._words[config] = words
+
+    def _remove(self, config: str):
+        for word in self._words.pop(config, ()):
+            postings = self._postings[word]
+            postings.pop(config, None)
+            if not postings:
+                del self._postings[word]
+
+    def lookup(self, word: str) -> list:
+        postings = [
+            {"config": config, "topic": topic, "prob": prob, "rank": rank}
+            for config, entries in self._postings.get(word, {}).items()
+            for topic, prob, rank in entries
+        ]
+        return sorted(postings, key=lambda posting: -posting["prob"])
+
+    # configs added or removed while the build runs are newer than the snapshot it reads
+    async def build(self, collection):
+        self._updated = set()
+        try:
+            async for topic in collection.find():
+                if topic["_id"] not in self._updated:
+                    self._add(topic)
+        finally:
+            self._updated = None
+        self.ready = True